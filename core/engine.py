@@ -4,17 +4,69 @@ Intelligent web scraping engine with automatic static/dynamic detection
 """
 
 import asyncio
+import hashlib
+import importlib.util
 import logging
-from typing import Dict, List, Optional, Union, Any
+import re
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union, Any, AsyncIterator
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from urllib.parse import urlparse
 import httpx
-from playwright.async_api import async_playwright, Browser, Page
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+from cssselect import HTMLTranslator
 import json
 
+if TYPE_CHECKING:
+    # Playwright is imported lazily in _init_browser; it is slow to import
+    # and only needed for dynamic scrapes
+    from playwright.async_api import Browser, BrowserContext, Page
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# httpx needs the h2 package (httpx[http2]) to negotiate HTTP/2
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Strips scripts, styles and tags to approximate visible text when probing
+_TAG_RE = re.compile(
+    rb'<script.*?</script>|<style.*?</style>|<[^>]+>',
+    re.DOTALL | re.IGNORECASE
+)
+
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+
+class _NoStoreCookiePolicy(DefaultCookiePolicy):
+    """Never store response cookies (per-request cookies are still sent)"""
+
+    def set_ok(self, cookie, request):
+        return False
+_CSS_TRANSLATOR = HTMLTranslator()
+
+
+# Text nodes of an element, minus script/style contents (which bs4's
+# get_text skips) but keeping the text that follows them
+_VISIBLE_TEXT = etree.XPath(
+    './/text()[not(parent::script or parent::style)]',
+    smart_strings=False
+)
+
+
+def _element_text(element) -> str:
+    """Concatenate stripped text nodes of an element (like get_text(strip=True))"""
+    if element.tag in ('script', 'style'):
+        # Selected directly (e.g. JSON-LD): its own contents are the text
+        return (element.text or '').strip()
+    return ''.join(text.strip() for text in _VISIBLE_TEXT(element))
+
 
 @dataclass
 class ScrapeOptions:
@@ -28,8 +80,11 @@ class ScrapeOptions:
     headers: Dict[str, str] = field(default_factory=dict)
     cookies: Dict[str, str] = field(default_factory=dict)
     wait_for_selector: Optional[str] = None
+    wait_until: str = 'domcontentloaded'  # or 'load', 'networkidle'
     wait_time: float = 0
     user_agent: Optional[str] = None
+    # Resource types the browser aborts during dynamic scrapes
+    block_resources: Set[str] = field(default_factory=lambda: {'image', 'font', 'media'})
 
 
 @dataclass
@@ -55,19 +110,35 @@ class ScraperEngine:
     - Concurrent request handling
     """
 
+    # Bytes of HTML sampled when probing for JavaScript rendering
+    SNIFF_BYTES = 50000
+
+    # Per-host memo of probe results
+    DYNAMIC_HOST_TTL = 3600  # seconds
+    DYNAMIC_HOST_CACHE_SIZE = 1024
+
     def __init__(
         self,
         rate_limiter=None,
         cache=None,
         proxy_manager=None,
-        user_agent_manager=None
+        user_agent_manager=None,
+        max_pages: int = 20
     ):
         self.rate_limiter = rate_limiter
         self.cache = cache
         self.proxy_manager = proxy_manager
         self.user_agent_manager = user_agent_manager
-        self._browser: Optional[Browser] = None
+        self._browser: Optional['Browser'] = None
         self._playwright = None
+        self._context: Optional['BrowserContext'] = None
+        self._browser_lock = asyncio.Lock()
+        self.max_pages = max_pages
+        self._page_pool: asyncio.Queue = asyncio.Queue()
+        self._http_clients: Dict[Optional[str], httpx.AsyncClient] = {}
+        self._selector_specs: Dict[str, Tuple[str, str, Optional[str]]] = {}
+        self._xpath_cache: Dict[str, etree.XPath] = {}
+        self._dynamic_host_cache: Dict[str, Tuple[bool, float]] = {}
 
         # JavaScript framework indicators
         self.js_frameworks = [
@@ -81,6 +152,16 @@ class ScraperEngine:
             'v-cloak', 'defer', 'async'
         ]
 
+        # Single case-insensitive alternation over all indicators, matched
+        # against raw response bytes in one pass
+        self._indicator_re = re.compile(
+            '|'.join(
+                re.escape(indicator)
+                for indicator in self.js_frameworks + self.dynamic_indicators
+            ).encode(),
+            re.IGNORECASE
+        )
+
     async def scrape(
         self,
         url: str,
@@ -90,6 +171,10 @@ class ScraperEngine:
         """
         Main scraping method with automatic static/dynamic detection
 
+        With caching enabled, extracted data is cached per (URL, selectors)
+        and the downloaded HTML per URL, so a new selector set for a
+        recently scraped page is extracted without refetching it.
+
         Args:
             url: Target URL to scrape
             selectors: Dictionary of {field_name: css_selector}
@@ -102,9 +187,12 @@ class ScraperEngine:
 
         logger.info(f"Starting scrape: {url}")
 
+        use_cache = options.use_cache and self.cache
+        data_key = f"data:{url}:{self._selectors_key(selectors)}"
+
         # Check cache first
-        if options.use_cache and self.cache:
-            cached = await self.cache.get(url)
+        if use_cache:
+            cached = await self.cache.get(data_key)
             if cached:
                 logger.info(f"Cache hit for {url}")
                 return ScrapeResult(
@@ -114,13 +202,20 @@ class ScraperEngine:
                     metadata={'cached': True, 'cache_hit_time': datetime.now()}
                 )
 
+        # Reuse downloaded HTML (same page, different selectors)
+        html = await self.cache.get(f"html:{url}") if use_cache else None
+        html_cached = html is not None
+
         # Apply rate limiting
-        if self.rate_limiter:
+        if self.rate_limiter and not html_cached:
             await self.rate_limiter.acquire()
 
         try:
             # Decide scraping strategy
-            if options.force_dynamic:
+            if html_cached:
+                logger.info(f"HTML cache hit for {url}")
+                load_time = 0.0
+            elif options.force_dynamic:
                 html, load_time = await self._fetch_dynamic(url, options)
             else:
                 # Try static first
@@ -136,8 +231,10 @@ class ScraperEngine:
             data = self._extract_data(html, selectors)
 
             # Store in cache
-            if options.use_cache and self.cache:
-                await self.cache.set(url, data, ttl=options.cache_ttl)
+            if use_cache:
+                if not html_cached:
+                    await self.cache.set(f"html:{url}", html, ttl=options.cache_ttl)
+                await self.cache.set(data_key, data, ttl=options.cache_ttl)
 
             result = ScrapeResult(
                 success=True,
@@ -145,6 +242,7 @@ class ScraperEngine:
                 data=data,
                 metadata={
                     'load_time_ms': load_time,
+                    'html_cached': html_cached,
                     'html_size_bytes': len(html),
                     'selectors_found': len([k for k, v in data.items() if v is not None]),
                     'timestamp': datetime.now().isoformat()
@@ -169,7 +267,8 @@ class ScraperEngine:
         urls: List[str],
         selectors: Dict[str, str],
         options: Optional[ScrapeOptions] = None,
-        concurrency: int = 5
+        concurrency: int = 20,
+        per_host_concurrency: int = 4
     ) -> List[ScrapeResult]:
         """
         Scrape multiple URLs concurrently
@@ -178,40 +277,90 @@ class ScraperEngine:
             urls: List of URLs to scrape
             selectors: CSS selectors to extract
             options: Scrape options
-            concurrency: Max concurrent requests
+            concurrency: Max concurrent requests overall
+            per_host_concurrency: Max concurrent requests to any one host
 
         Returns:
             List of ScrapeResults
         """
         logger.info(f"Starting batch scrape of {len(urls)} URLs")
 
-        semaphore = asyncio.Semaphore(concurrency)
+        results: List[Optional[ScrapeResult]] = [None] * len(urls)
+        async for i, result in self._scrape_as_completed(
+            urls, selectors, options, concurrency, per_host_concurrency
+        ):
+            results[i] = result
+
+        success_count = sum(1 for r in results if r.success)
+        logger.info(f"Batch scrape completed: {success_count}/{len(urls)} successful")
 
-        async def scrape_with_semaphore(url):
-            async with semaphore:
-                return await self.scrape(url, selectors, options)
+        return results
+
+    async def scrape_stream(
+        self,
+        urls: List[str],
+        selectors: Dict[str, str],
+        options: Optional[ScrapeOptions] = None,
+        concurrency: int = 20,
+        per_host_concurrency: int = 4
+    ) -> AsyncIterator[ScrapeResult]:
+        """
+        Scrape multiple URLs concurrently, yielding results as they finish
 
-        tasks = [scrape_with_semaphore(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Results arrive in completion order, so consumers can process and
+        release them without waiting for the whole batch.
 
-        # Convert exceptions to failed results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append(ScrapeResult(
+        Args:
+            urls: List of URLs to scrape
+            selectors: CSS selectors to extract
+            options: Scrape options
+            concurrency: Max concurrent requests overall
+            per_host_concurrency: Max concurrent requests to any one host
+
+        Yields:
+            ScrapeResults in completion order
+        """
+        async for _, result in self._scrape_as_completed(
+            urls, selectors, options, concurrency, per_host_concurrency
+        ):
+            yield result
+
+    async def _scrape_as_completed(
+        self,
+        urls: List[str],
+        selectors: Dict[str, str],
+        options: Optional[ScrapeOptions],
+        concurrency: int,
+        per_host_concurrency: int
+    ) -> AsyncIterator[Tuple[int, ScrapeResult]]:
+        """Run bounded concurrent scrapes, yielding (url index, result) as each completes"""
+        semaphore = asyncio.Semaphore(concurrency)
+        host_semaphores = defaultdict(lambda: asyncio.Semaphore(per_host_concurrency))
+
+        async def scrape_with_semaphore(i, url):
+            try:
+                # Host slot first, so tasks queued on a busy host don't hold global slots
+                async with host_semaphores[urlparse(url).netloc], semaphore:
+                    return i, await self.scrape(url, selectors, options)
+            except Exception as e:
+                # Convert exceptions to failed results
+                return i, ScrapeResult(
                     success=False,
-                    url=urls[i],
+                    url=url,
                     data={},
                     metadata={},
-                    error=str(result)
-                ))
-            else:
-                processed_results.append(result)
+                    error=str(e)
+                )
 
-        success_count = sum(1 for r in processed_results if r.success)
-        logger.info(f"Batch scrape completed: {success_count}/{len(urls)} successful")
+        tasks = [asyncio.ensure_future(scrape_with_semaphore(i, url)) for i, url in enumerate(urls)]
 
-        return processed_results
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early - don't leave scrapes running
+            for task in tasks:
+                task.cancel()
 
     async def _should_use_dynamic(self, url: str) -> bool:
         """
@@ -219,8 +368,9 @@ class ScraperEngine:
 
         Strategy:
         1. Check URL patterns (SPAs often use hash routing)
-        2. Make quick HEAD request to check headers
-        3. Sample HTML for JS framework indicators
+        2. Reuse a recent result for the same host
+        3. Stream a single GET and check content-type headers
+        4. Sample the first 50KB of HTML for JS framework indicators
 
         Args:
             url: URL to check
@@ -232,39 +382,90 @@ class ScraperEngine:
         if '#/' in url or url.endswith('.js'):
             return True
 
+        host = urlparse(url).netloc
+        cached = await self._get_dynamic_host(host)
+        if cached is not None:
+            return cached
+
         try:
-            async with httpx.AsyncClient() as client:
-                # Quick HEAD request
-                head_response = await client.head(url, timeout=5.0, follow_redirects=True)
-                content_type = head_response.headers.get('content-type', '')
+            client = self._get_http_client()
+
+            # Single streaming GET: check headers, then sample first 50KB only
+            async with client.stream('GET', url, timeout=5.0) as response:
+                content_type = response.headers.get('content-type', '')
 
                 # If it's not HTML, we don't need browser
                 if 'text/html' not in content_type:
                     return False
 
-                # Sample first 50KB of HTML
-                response = await client.get(url, timeout=10.0)
-                html_sample = response.text[:50000]
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes(chunk_size=8192):
+                    buffer += chunk
+                    if len(buffer) >= self.SNIFF_BYTES:
+                        break
 
-                # Check for JavaScript framework indicators
-                for indicator in self.js_frameworks + self.dynamic_indicators:
-                    if indicator.lower() in html_sample.lower():
-                        logger.debug(f"Found JS indicator '{indicator}' in {url}")
-                        return True
+            sample_bytes = bytes(buffer[:self.SNIFF_BYTES])
 
+            # Check for JavaScript framework indicators
+            match = self._indicator_re.search(sample_bytes)
+            if match:
+                logger.debug(f"Found JS indicator '{match.group().decode()}' in {url}")
+                needs_dynamic = True
+            else:
                 # Check for minimal content (might be JS-rendered)
-                soup = BeautifulSoup(html_sample, 'html.parser')
-                body_text = soup.get_text(strip=True)
-                if len(body_text) < 100:  # Very little content, probably JS-rendered
-                    return True
-
-                return False
+                body_text = _TAG_RE.sub(b'', sample_bytes)
+                needs_dynamic = len(body_text.strip()) < 100
 
         except Exception as e:
             logger.warning(f"Error checking if dynamic needed for {url}: {e}")
             # Default to static if check fails
             return False
 
+        await self._set_dynamic_host(host, needs_dynamic)
+        return needs_dynamic
+
+    async def _get_dynamic_host(self, host: str) -> Optional[bool]:
+        """
+        Get a cached probe result for a host
+
+        Args:
+            host: URL netloc
+
+        Returns:
+            Cached result or None if unknown/expired
+        """
+        entry = self._dynamic_host_cache.get(host)
+        if entry is not None:
+            needs_dynamic, stored_at = entry
+            if time.monotonic() - stored_at < self.DYNAMIC_HOST_TTL:
+                return needs_dynamic
+            del self._dynamic_host_cache[host]
+
+        if self.cache:
+            needs_dynamic = await self.cache.get(f"dynamic:{host}")
+            if needs_dynamic is not None:
+                self._dynamic_host_cache[host] = (needs_dynamic, time.monotonic())
+            return needs_dynamic
+
+        return None
+
+    async def _set_dynamic_host(self, host: str, needs_dynamic: bool):
+        """
+        Remember a probe result for a host
+
+        Args:
+            host: URL netloc
+            needs_dynamic: Probe result
+        """
+        if len(self._dynamic_host_cache) >= self.DYNAMIC_HOST_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._dynamic_host_cache.pop(next(iter(self._dynamic_host_cache)))
+
+        self._dynamic_host_cache[host] = (needs_dynamic, time.monotonic())
+
+        if self.cache:
+            await self.cache.set(f"dynamic:{host}", needs_dynamic, ttl=self.DYNAMIC_HOST_TTL)
+
     async def _fetch_static(
         self,
         url: str,
@@ -287,26 +488,23 @@ class ScraperEngine:
 
         proxy = options.proxy or (self.proxy_manager.get_proxy() if self.proxy_manager else None)
 
-        start_time = datetime.now()
-
-        async with httpx.AsyncClient(
-            timeout=options.timeout,
-            proxies=proxy,
-            follow_redirects=True
-        ) as client:
-            response = await client.get(
-                url,
-                headers=headers,
-                cookies=options.cookies
-            )
-            response.raise_for_status()
+        start_time = time.perf_counter()
 
-            if options.wait_time > 0:
-                await asyncio.sleep(options.wait_time)
+        client = self._get_http_client(proxy)
+        response = await client.get(
+            url,
+            headers=headers,
+            cookies=options.cookies or None,
+            timeout=options.timeout
+        )
+        response.raise_for_status()
+
+        if options.wait_time > 0:
+            await asyncio.sleep(options.wait_time)
 
-            load_time = (datetime.now() - start_time).total_seconds() * 1000
+        load_time = (time.perf_counter() - start_time) * 1000
 
-            return response.text, load_time
+        return response.text, load_time
 
     async def _fetch_dynamic(
         self,
@@ -326,24 +524,43 @@ class ScraperEngine:
         if not self._browser:
             await self._init_browser()
 
-        start_time = datetime.now()
-
-        page: Page = await self._browser.new_page()
+        # Per-request cookies would leak to other scrapes through the shared
+        # context, so those scrapes get a throwaway context instead
+        private_context: Optional['BrowserContext'] = None
+        if options.cookies:
+            private_context = await self._browser.new_context(user_agent=self._get_user_agent())
+            try:
+                await private_context.add_cookies([
+                    {'name': k, 'value': v, 'url': url}
+                    for k, v in options.cookies.items()
+                ])
+                page: 'Page' = await private_context.new_page()
+            except Exception:
+                await private_context.close()
+                raise
+        else:
+            page = await self._acquire_page()
+
+        # Routing disables the browser's HTTP cache, so only intercept
+        # requests while a scrape actually blocks something
+        route_handler = None
+        if options.block_resources:
+            blocked = options.block_resources
+            route_handler = lambda route: self._route_request(route, blocked)
+
+        # Page setup above isn't part of the page's load time
+        start_time = time.perf_counter()
 
         try:
+            if route_handler:
+                await page.route('**/*', route_handler)
+
             # Set user agent
             if options.user_agent:
                 await page.set_extra_http_headers({'User-Agent': options.user_agent})
 
-            # Set cookies
-            if options.cookies:
-                await page.context.add_cookies([
-                    {'name': k, 'value': v, 'url': url}
-                    for k, v in options.cookies.items()
-                ])
-
             # Navigate to page
-            await page.goto(url, timeout=options.timeout * 1000, wait_until='networkidle')
+            await page.goto(url, timeout=options.timeout * 1000, wait_until=options.wait_until)
 
             # Wait for specific selector if provided
             if options.wait_for_selector:
@@ -356,17 +573,99 @@ class ScraperEngine:
             # Get HTML content
             html = await page.content()
 
-            load_time = (datetime.now() - start_time).total_seconds() * 1000
+            load_time = (time.perf_counter() - start_time) * 1000
 
             return html, load_time
 
         finally:
+            if private_context:
+                await private_context.close()
+            else:
+                await self._release_page(
+                    page,
+                    reset_headers=bool(options.user_agent),
+                    route_handler=route_handler
+                )
+
+    async def _release_page(
+        self,
+        page: 'Page',
+        reset_headers: bool = False,
+        route_handler=None
+    ):
+        """
+        Reset a browser page and return it to the pool
+
+        Pages share one browser context, so cookies and the HTTP cache
+        persist across scrapes (the cache is bypassed while a scrape
+        blocks resources, as routing disables it). At most max_pages idle
+        pages are kept; extras and pages that fail to reset are closed.
+
+        Args:
+            page: Page previously taken from the pool
+            reset_headers: Clear per-scrape header overrides
+            route_handler: Resource-blocking route installed for the scrape
+        """
+        try:
+            if route_handler:
+                await page.unroute('**/*', route_handler)
+            await page.goto('about:blank')
+            if reset_headers:
+                await page.set_extra_http_headers({})
+        except Exception as e:
+            # Drop the page; _acquire_page opens a new one when needed
+            logger.warning(f"Discarding browser page after failed reset: {e}")
+            await self._close_page(page)
+            return
+
+        if self._page_pool.qsize() >= self.max_pages:
+            await self._close_page(page)
+        else:
+            self._page_pool.put_nowait(page)
+
+    async def _acquire_page(self) -> 'Page':
+        """
+        Take an idle page from the pool, or open one if none is free
+
+        Never waits for another scrape to finish, so any caller-side
+        concurrency is served (idle pages beyond max_pages are closed
+        on release).
+
+        Returns:
+            Page in the shared context
+        """
+        try:
+            return self._page_pool.get_nowait()
+        except asyncio.QueueEmpty:
+            return await self._new_page()
+
+    @staticmethod
+    async def _close_page(page: 'Page'):
+        """Close a page, ignoring errors from an already-dead page"""
+        try:
             await page.close()
+        except Exception:
+            pass
+
+    async def _new_page(self) -> 'Page':
+        """Open a page in the shared context"""
+        return await self._context.new_page()
+
+    @staticmethod
+    async def _route_request(route, blocked: Set[str]):
+        """Abort requests for resource types the current scrape doesn't need"""
+        if route.request.resource_type in blocked:
+            await route.abort()
+        else:
+            await route.continue_()
 
     def _extract_data(self, html: str, selectors: Dict[str, str]) -> Dict[str, Any]:
         """
         Extract data from HTML using CSS selectors
 
+        The document is parsed once per call; selectors are translated to
+        XPath once per engine and reused across calls.
+
         Args:
             html: HTML content
             selectors: Dictionary of {field_name: css_selector}
@@ -374,34 +673,31 @@ class ScraperEngine:
         Returns:
             Dictionary of extracted data
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        try:
+            tree = lxml_html.document_fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+        except etree.ParserError:
+            # Empty document - nothing will match
+            tree = lxml_html.document_fromstring(b'<html></html>')
         data = {}
 
         for field_name, selector in selectors.items():
             try:
-                # Handle special selector syntax
-                if '::text' in selector:
-                    # Extract text content
-                    selector = selector.replace('::text', '')
-                    element = soup.select_one(selector)
-                    data[field_name] = element.get_text(strip=True) if element else None
+                mode, css, attr = self._parse_selector(selector)
+                xpath = self._compile_selector(css)
 
-                elif '::attr(' in selector:
-                    # Extract attribute value
-                    attr_match = selector.split('::attr(')[1].rstrip(')')
-                    selector = selector.split('::attr(')[0]
-                    element = soup.select_one(selector)
-                    data[field_name] = element.get(attr_match) if element else None
-
-                elif selector.startswith('['):
+                if mode == 'list':
                     # Multiple elements (returns list)
-                    elements = soup.select(selector.strip('[]'))
-                    data[field_name] = [elem.get_text(strip=True) for elem in elements]
+                    data[field_name] = [_element_text(elem) for elem in xpath(tree)]
+
+                elif mode == 'attr':
+                    # Extract attribute value
+                    elements = xpath(tree)
+                    data[field_name] = elements[0].get(attr) if elements else None
 
                 else:
-                    # Default: extract text content
-                    element = soup.select_one(selector)
-                    data[field_name] = element.get_text(strip=True) if element else None
+                    # Extract text content
+                    elements = xpath(tree)
+                    data[field_name] = _element_text(elements[0]) if elements else None
 
             except Exception as e:
                 logger.warning(f"Error extracting field '{field_name}' with selector '{selector}': {e}")
@@ -409,18 +705,139 @@ class ScraperEngine:
 
         return data
 
+    def precompile_selectors(self, selectors: Dict[str, str]):
+        """
+        Parse and compile selectors ahead of the first scrape
+
+        Extraction compiles lazily and caches per engine; warming up front
+        keeps CSS-to-XPath translation off the scrape path and surfaces an
+        invalid selector once, instead of as a warning on every page.
+
+        Args:
+            selectors: Dictionary of {field_name: css_selector}
+
+        Raises:
+            cssselect.SelectorError: If a selector is not valid CSS
+        """
+        for selector in selectors.values():
+            _, css, _ = self._parse_selector(selector)
+            self._compile_selector(css)
+
+    @staticmethod
+    def _selectors_key(selectors: Dict[str, str]) -> str:
+        """Short stable digest of a selectors dict for cache keys"""
+        if orjson:
+            encoded = orjson.dumps(selectors, option=orjson.OPT_SORT_KEYS)
+        else:
+            # Byte-identical to orjson's compact output
+            encoded = json.dumps(
+                selectors, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+            ).encode()
+        return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+    def _parse_selector(self, selector: str) -> Tuple[str, str, Optional[str]]:
+        """
+        Split selector syntax into (mode, css, attribute), cached per selector
+
+        Supported syntax:
+        - 'css::text' or 'css': text of first match
+        - 'css::attr(name)': attribute of first match
+        - '[css]': text of all matches (list)
+
+        Args:
+            selector: Selector string
+
+        Returns:
+            Tuple of (mode, pure CSS selector, attribute name or None)
+        """
+        parsed = self._selector_specs.get(selector)
+        if parsed is None:
+            if '::text' in selector:
+                parsed = ('text', selector.replace('::text', ''), None)
+            elif '::attr(' in selector:
+                css, attr = selector.split('::attr(')[:2]
+                parsed = ('attr', css, attr.rstrip(')'))
+            elif selector.startswith('['):
+                parsed = ('list', selector.strip('[]'), None)
+            else:
+                parsed = ('text', selector, None)
+            self._selector_specs[selector] = parsed
+        return parsed
+
+    def _compile_selector(self, css: str) -> etree.XPath:
+        """
+        Get compiled XPath for a CSS selector, translating it on first use
+
+        Args:
+            css: CSS selector
+
+        Returns:
+            Compiled etree.XPath
+        """
+        xpath = self._xpath_cache.get(css)
+        if xpath is None:
+            xpath = etree.XPath(_CSS_TRANSLATOR.css_to_xpath(css))
+            self._xpath_cache[css] = xpath
+        return xpath
+
+    def _get_http_client(self, proxy: Optional[str] = None) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client for a proxy, creating it on first use
+
+        Clients are kept for the lifetime of the engine so keep-alive
+        connections are reused across scrapes. httpx binds proxies at the
+        client level, so there is one client per proxy (None = direct).
+        HTTP/2 is enabled when available, multiplexing concurrent requests
+        to a host over one connection; HTTP/1.1-only servers are unaffected.
+        The client's cookie jar never stores Set-Cookie values, so cookies
+        from one scrape don't leak into later scrapes of other sites.
+
+        Args:
+            proxy: Proxy URL or None for direct connections
+
+        Returns:
+            Pooled httpx.AsyncClient
+        """
+        client = self._http_clients.get(proxy)
+        if client is None:
+            client = httpx.AsyncClient(
+                proxy=proxy,
+                # Idle connections outlive httpx's 5s default so hosts revisited
+                # later in a run skip the TCP/TLS handshake
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0
+                ),
+                follow_redirects=True,
+                http2=_HTTP2_AVAILABLE,
+                cookies=CookieJar(policy=_NoStoreCookiePolicy())
+            )
+            self._http_clients[proxy] = client
+        return client
+
     async def _init_browser(self):
-        """Initialize Playwright browser instance"""
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox'
-            ]
-        )
-        logger.info("Browser initialized")
+        """Initialize Playwright browser instance and the shared context"""
+        async with self._browser_lock:
+            if self._browser:
+                return
+
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+            browser = await self._playwright.chromium.launch(
+                headless=True,
+                args=[
+                    '--disable-blink-features=AutomationControlled',
+                    '--disable-dev-shm-usage',
+                    '--no-sandbox'
+                ]
+            )
+
+            self._context = await browser.new_context(user_agent=self._get_user_agent())
+
+            self._browser = browser
+            logger.info(f"Browser initialized (up to {self.max_pages} pooled pages)")
 
     def _get_user_agent(self) -> str:
         """Get user agent from manager or use default"""
@@ -430,10 +847,20 @@ class ScraperEngine:
 
     async def close(self):
         """Cleanup resources"""
+        for client in self._http_clients.values():
+            await client.aclose()
+        self._http_clients.clear()
+        while not self._page_pool.empty():
+            await self._page_pool.get_nowait().close()
+        if self._context:
+            await self._context.close()
+            self._context = None
         if self._browser:
             await self._browser.close()
+            self._browser = None
         if self._playwright:
             await self._playwright.stop()
+            self._playwright = None
         logger.info("Engine closed")
 
     async def __aenter__(self):
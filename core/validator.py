@@ -6,9 +6,66 @@ Enforces REAL_DATA_POLICY.md requirements
 
 import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    # C ISO-8601 parser, much faster than fromisoformat for large datasets
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    def _parse_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _unescape_literal(pattern: str) -> Optional[str]:
+    """Return the literal text a regex matches, or None if it uses regex syntax"""
+    chars = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return None  # Character class like \s or \w
+            chars.append(pattern[i + 1])
+            i += 2
+        elif char in '.^$*+?{}[]|()':
+            return None
+        else:
+            chars.append(char)
+            i += 1
+    return ''.join(chars)
+
+
+def _split_patterns(patterns: List[str]) -> Dict:
+    """
+    Partition re.match patterns into literal prefix/suffix/exact checks and
+    a residual regex, so clean values rarely reach the regex engine
+
+    Literals are lowercased to mirror re.IGNORECASE.
+    """
+    prefixes, suffixes, exact, residual = [], [], [], []
+
+    for pattern in patterns:
+        body = pattern[1:] if pattern.startswith('^') else pattern
+        if body.startswith('.*') and body.endswith('$'):
+            literal, kind = _unescape_literal(body[2:-1]), suffixes
+        elif body.endswith('$'):
+            literal, kind = _unescape_literal(body[:-1]), exact
+        else:
+            literal, kind = _unescape_literal(body), prefixes
+
+        if literal is None:
+            residual.append(pattern)
+        else:
+            kind.append(literal.lower())
+
+    return {
+        'prefixes': tuple(prefixes),
+        'suffixes': tuple(suffixes),
+        'exact': frozenset(exact),
+        'regex': re.compile('|'.join(f'(?:{p})' for p in residual), re.IGNORECASE) if residual else None,
+    }
+
 
 class RealDataValidator:
     """
@@ -57,6 +114,24 @@ class RealDataValidator:
         ]
     }
 
+    # One case-insensitive alternation per field for the common no-match case
+    _COMPILED_PATTERNS = {
+        field: re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+        for field, patterns in PROHIBITED_PATTERNS.items()
+    }
+
+    # Literal fast paths (str.startswith/endswith) plus residual regex per field
+    _FAST_CHECKS = {
+        field: _split_patterns(patterns)
+        for field, patterns in PROHIBITED_PATTERNS.items()
+    }
+
+    # Individually compiled patterns, used to report every match on a hit
+    _PATTERN_LISTS = {
+        field: [(p, re.compile(p, re.IGNORECASE)) for p in patterns]
+        for field, patterns in PROHIBITED_PATTERNS.items()
+    }
+
     # Approved data sources (real data only)
     APPROVED_SOURCES = [
         'Apollo.io API',
@@ -76,6 +151,8 @@ class RealDataValidator:
         'Secretary of State Registry',
     ]
 
+    APPROVED_SOURCES_SET = frozenset(APPROVED_SOURCES)
+
     # Prohibited sources (demo/mock data)
     PROHIBITED_SOURCES = [
         'demo',
@@ -87,6 +164,14 @@ class RealDataValidator:
         'fake',
     ]
 
+    _PROHIBITED_SRC_RE = re.compile(
+        '|'.join(re.escape(source) for source in PROHIBITED_SOURCES),
+        re.IGNORECASE
+    )
+
+    # Datasets this large are pre-screened with vectorized pandas checks
+    DATAFRAME_THRESHOLD = 10000
+
     def __init__(self, strict_mode: bool = True):
         """
         Initialize validator
@@ -97,12 +182,17 @@ class RealDataValidator:
         self.strict_mode = strict_mode
         self.validation_results = []
 
-    def validate_prospect(self, prospect: Dict) -> Tuple[bool, List[str]]:
+    def validate_prospect(
+        self,
+        prospect: Dict,
+        now: Optional[datetime] = None
+    ) -> Tuple[bool, List[str]]:
         """
         Validate a single prospect record
 
         Args:
             prospect: Prospect data dictionary
+            now: Reference time for date checks (defaults to current time)
 
         Returns:
             (is_valid, error_messages)
@@ -123,13 +213,29 @@ class RealDataValidator:
                 errors.append(f"❌ Missing required field: {field}")
 
         # 2. Check for prohibited patterns (MOCK DATA)
-        for field, patterns in self.PROHIBITED_PATTERNS.items():
+        for field, checks in self._FAST_CHECKS.items():
             value = prospect.get(field, '')
             if not value:
                 continue
 
-            for pattern in patterns:
-                if re.match(pattern, str(value), re.IGNORECASE):
+            value = str(value)
+            lowered = value.lower()
+            # '$' also matches just before a trailing newline
+            if lowered.endswith('\n'):
+                lowered_end = lowered[:-1]
+            else:
+                lowered_end = lowered
+            regex = checks['regex']
+            if not (
+                lowered.startswith(checks['prefixes'])
+                or lowered_end.endswith(checks['suffixes'])
+                or lowered_end in checks['exact']
+                or (regex is not None and regex.match(value))
+            ):
+                continue
+
+            for pattern, compiled in self._PATTERN_LISTS[field]:
+                if compiled.match(value):
                     errors.append(
                         f"❌ PROHIBITED: {field} matches mock data pattern: '{pattern}'\n"
                         f"   Value: '{value}'\n"
@@ -139,17 +245,19 @@ class RealDataValidator:
         # 3. Check data source is approved
         data_source = prospect.get('data_source', '')
 
-        # Check for prohibited sources
-        for prohibited in self.PROHIBITED_SOURCES:
-            if prohibited.lower() in data_source.lower():
-                errors.append(
-                    f"❌ PROHIBITED DATA SOURCE: '{data_source}'\n"
-                    f"   Contains prohibited keyword: '{prohibited}'\n"
-                    f"   This is MOCK/DEMO data and cannot be used in production."
-                )
+        # Check for prohibited sources (one scan; report each keyword on a hit)
+        if self._PROHIBITED_SRC_RE.search(data_source):
+            data_source_lower = data_source.lower()
+            for prohibited in self.PROHIBITED_SOURCES:
+                if prohibited in data_source_lower:
+                    errors.append(
+                        f"❌ PROHIBITED DATA SOURCE: '{data_source}'\n"
+                        f"   Contains prohibited keyword: '{prohibited}'\n"
+                        f"   This is MOCK/DEMO data and cannot be used in production."
+                    )
 
         # Check if source is approved
-        if data_source and data_source not in self.APPROVED_SOURCES:
+        if data_source and data_source not in self.APPROVED_SOURCES_SET:
             warnings.append(
                 f"⚠️  Unknown data source: '{data_source}'\n"
                 f"   Approved sources: {', '.join(self.APPROVED_SOURCES[:5])}..."
@@ -163,8 +271,8 @@ class RealDataValidator:
         verified_date = prospect.get('verified_date')
         if verified_date:
             try:
-                date_obj = datetime.fromisoformat(verified_date.replace('Z', '+00:00'))
-                age_days = (datetime.now() - date_obj).days
+                date_obj = _parse_datetime(verified_date)
+                age_days = ((now or datetime.now()) - date_obj.replace(tzinfo=None)).days
 
                 if age_days > 180:  # 6 months
                     warnings.append(
@@ -209,24 +317,114 @@ class RealDataValidator:
         Args:
             prospects: List of prospect dictionaries
 
+        Returns:
+            Validation results summary
+        """
+        return self._build_results(len(prospects), enumerate(prospects))
+
+    def validate_dataset_df(self, df) -> Dict:
+        """
+        Validate a pandas DataFrame of prospects
+
+        Column-wise checks flag every row that can fail validation; only
+        flagged rows go through validate_prospect, so results (and
+        messages) match validate_dataset while clean rows skip the
+        per-row Python path entirely.
+
+        Args:
+            df: DataFrame with one prospect per row
+
+        Returns:
+            Validation results summary
+        """
+        import pandas as pd
+
+        def column(name):
+            if name in df.columns:
+                return df[name]
+            return pd.Series('', index=df.index, dtype=object)
+
+        def falsy(name):
+            col = column(name)
+            return col.isna() | ~col.astype(bool)
+
+        # Errors
+        flagged = pd.Series(False, index=df.index)
+        for field in ('company_name', 'website', 'data_source', 'verified_date'):
+            flagged |= falsy(field)
+
+        for field, combined in self._COMPILED_PATTERNS.items():
+            flagged |= ~falsy(field) & column(field).astype(str).str.match(combined)
+
+        data_source = column('data_source').astype(str)
+        flagged |= data_source.str.contains(self._PROHIBITED_SRC_RE)
+
+        # Warnings (only invalidate in strict mode)
+        if self.strict_mode:
+            flagged |= ~falsy('data_source') & ~data_source.isin(self.APPROVED_SOURCES_SET)
+            flagged |= falsy('verified_website')
+
+            # Unparseable or possibly stale dates (one day of slack for timezones)
+            verified = pd.to_datetime(
+                column('verified_date'), format='ISO8601', errors='coerce', utc=True
+            )
+            age = pd.Timestamp.now(tz='UTC') - verified
+            flagged |= ~falsy('verified_date') & (verified.isna() | (age > pd.Timedelta(days=179)))
+
+            # pandas accepts dates _parse_datetime rejects (e.g. '2026-10-1'),
+            # so re-check the remaining distinct values the per-row way
+            dates = column('verified_date')
+            unflagged = dates[~flagged & ~falsy('verified_date')].unique()
+            rejected = [value for value in unflagged if not _parses_as_datetime(value)]
+            if rejected:
+                flagged |= dates.isin(rejected)
+
+            confidence = pd.to_numeric(column('verification_confidence'), errors='coerce')
+            flagged |= ~(confidence >= 70)
+
+            for field in ('contact_name', 'contact_email', 'contact_title'):
+                flagged |= falsy(field)
+
+        positions = flagged.to_numpy().nonzero()[0].tolist()
+        records = df.iloc[positions].to_dict('records')
+
+        # Drop missing cells so flagged rows look like the original dicts
+        rows = (
+            (i, _restore_record(record))
+            for i, record in zip(positions, records)
+        )
+
+        return self._build_results(len(df), rows)
+
+    def _build_results(self, total: int, rows) -> Dict:
+        """
+        Validate (index, prospect) pairs and build the results summary
+
+        Rows not passed in are counted as valid.
+
+        Args:
+            total: Total number of prospects in the dataset
+            rows: Iterable of (index, prospect) pairs to validate
+
         Returns:
             Validation results summary
         """
         results = {
-            'total': len(prospects),
-            'valid': 0,
+            'total': total,
+            'valid': total,
             'invalid': 0,
             'warnings': 0,
             'errors_by_prospect': [],
             'summary': {}
         }
 
-        for i, prospect in enumerate(prospects):
-            is_valid, issues = self.validate_prospect(prospect)
+        now = datetime.now()
 
-            if is_valid:
-                results['valid'] += 1
-            else:
+        for i, prospect in rows:
+            is_valid, issues = self.validate_prospect(prospect, now)
+
+            if not is_valid:
+                results['valid'] -= 1
                 results['invalid'] += 1
 
                 # Separate errors from warnings
@@ -336,6 +534,41 @@ class RealDataValidator:
         return valid_prospects
 
 
+def _is_missing(value) -> bool:
+    """Check for None/NaN cells in DataFrame records"""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _parses_as_datetime(value) -> bool:
+    """Check whether validate_prospect would accept a verified_date value"""
+    try:
+        _parse_datetime(value)
+    except (ValueError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def _restore_record(record: Dict) -> Dict:
+    """
+    Turn a DataFrame record back into the prospect dict it came from
+
+    Missing cells are dropped, and whole-number confidences are cast back
+    to int (pandas stores int columns with gaps as float, which would
+    show up as '50.0/100' in messages).
+
+    Args:
+        record: Row from DataFrame.to_dict('records')
+
+    Returns:
+        Prospect dictionary
+    """
+    prospect = {k: v for k, v in record.items() if not _is_missing(v)}
+    confidence = prospect.get('verification_confidence')
+    if isinstance(confidence, float) and confidence.is_integer():
+        prospect['verification_confidence'] = int(confidence)
+    return prospect
+
+
 # Convenience function for quick validation
 def validate_prospects(prospects: List[Dict], strict: bool = True) -> bool:
     """
@@ -358,9 +591,13 @@ def validate_prospects(prospects: List[Dict], strict: bool = True) -> bool:
 # CLI interface
 if __name__ == "__main__":
     import sys
-    import json
     import csv
 
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
     if len(sys.argv) < 2:
         print("Usage: python validator.py <prospects.csv|prospects.json>")
         sys.exit(1)
@@ -369,19 +606,23 @@ if __name__ == "__main__":
 
     # Load prospects
     if file_path.suffix == '.json':
-        with open(file_path, 'r') as f:
-            prospects = json.load(f)
+        with open(file_path, 'rb') as f:
+            prospects = json_loads(f.read())
     elif file_path.suffix == '.csv':
-        with open(file_path, 'r') as f:
-            reader = csv.DictReader(f)
-            prospects = list(reader)
+        # '' for missing cells, matching the enricher's output
+        with open(file_path, 'r', newline='', encoding='utf-8') as f:
+            prospects = list(csv.DictReader(f, restval=''))
     else:
         print(f"Unsupported file format: {file_path.suffix}")
         sys.exit(1)
 
-    # Validate
+    # Validate (vectorized for large datasets; only those need pandas)
     validator = RealDataValidator(strict_mode=True)
-    results = validator.validate_dataset(prospects)
+    if len(prospects) >= RealDataValidator.DATAFRAME_THRESHOLD:
+        import pandas as pd
+        results = validator.validate_dataset_df(pd.DataFrame(prospects))
+    else:
+        results = validator.validate_dataset(prospects)
     validator.print_validation_report(results)
 
     # Exit with error code if validation failed
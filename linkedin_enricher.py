@@ -5,7 +5,7 @@ LinkedIn Sales Navigator Enricher
 Takes LinkedIn Sales Nav export and enriches with website data.
 
 Usage:
-    python3 linkedin_enricher.py linkedin_export.csv
+    python3 linkedin_enricher.py linkedin_export.csv [--force-rescrape]
 
 Input CSV (from Sales Nav):
     - company_name
@@ -26,25 +26,82 @@ Output:
 
 import asyncio
 import csv
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+from urllib.parse import urlparse
+
+import pandas as pd
 
 # Add core to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from core.engine import ScraperEngine, ScrapeOptions
 from core.validator import RealDataValidator
-
-
-async def enrich_company(engine: ScraperEngine, company: Dict) -> Dict:
+from middleware.rate_limiter import DomainRateLimiter
+from middleware.cache import ResponseCache, SQLiteCache
+
+# Scraped website data is reused across runs for a week
+CACHE_TTL = 7 * 24 * 3600
+
+# Failed sites are skipped on re-runs for an hour
+NEGATIVE_CACHE_TTL = 3600
+
+# Output column order
+FIELDNAMES = [
+    'company_name', 'industry', 'location', 'employees',
+    'website', 'phone', 'email', 'address',
+    'services', 'certifications', 'linkedin_url',
+    'data_source', 'verified_date', 'verified_website',
+    'verification_confidence'
+]
+
+# Selectors for common website elements (shared by every company; the
+# engine does not mutate them)
+_SELECTORS = {
+    # Phone numbers
+    'phone': '[href^="tel:"]::attr(href), .phone, .contact-phone, footer a[href^="tel:"]',
+
+    # Email addresses
+    'email': '[href^="mailto:"]::attr(href), .email, .contact-email',
+
+    # Address
+    'address': '.address, [itemprop="address"], .contact-address, footer .address',
+
+    # Services/capabilities
+    'services': '.services, .capabilities, .what-we-do, .solutions, main h2, main h3',
+
+    # Certifications/licenses
+    'certifications': '.certifications, .licenses, .accreditations, .memberships, .awards',
+}
+
+_SCRAPE_OPTIONS = ScrapeOptions(
+    timeout=15,
+    retry_count=2,
+    wait_time=1.0
+)
+
+
+async def enrich_company(
+    engine: ScraperEngine,
+    company: Dict,
+    rate_limiter: Optional[DomainRateLimiter] = None,
+    response_cache: Optional[ResponseCache] = None,
+    force_rescrape: bool = False,
+    verified_date: Optional[str] = None
+) -> Dict:
     """
     Enrich a single company with website data
 
     Args:
         engine: ScraperEngine instance
         company: Company data from LinkedIn
+        rate_limiter: Per-host limiter applied before scraping
+        response_cache: Cache of scraped website data, checked before scraping
+        force_rescrape: Ignore cached results (including known failures)
+        verified_date: ISO timestamp shared by the run (defaults to now)
 
     Returns:
         Enriched company data
@@ -67,7 +124,7 @@ async def enrich_company(engine: ScraperEngine, company: Dict) -> Dict:
 
         # Metadata
         'data_source': 'LinkedIn Sales Navigator + Website Enrichment',
-        'verified_date': datetime.now().isoformat(),
+        'verified_date': verified_date or datetime.now().isoformat(),
         'verified_website': False,
         'verification_confidence': 70  # Base score from LinkedIn
     }
@@ -83,37 +140,46 @@ async def enrich_company(engine: ScraperEngine, company: Dict) -> Dict:
         website = f'https://{website}'
         prospect['website'] = website
 
+    claim = None
     try:
-        # Define selectors for common website elements
-        selectors = {
-            # Phone numbers
-            'phone': '[href^="tel:"]::attr(href), .phone, .contact-phone, footer a[href^="tel:"]',
-
-            # Email addresses
-            'email': '[href^="mailto:"]::attr(href), .email, .contact-email',
-
-            # Address
-            'address': '.address, [itemprop="address"], .contact-address, footer .address',
-
-            # Services/capabilities
-            'services': '.services, .capabilities, .what-we-do, .solutions, main h2, main h3',
-
-            # Certifications/licenses
-            'certifications': '.certifications, .licenses, .accreditations, .memberships, .awards',
-        }
-
-        options = ScrapeOptions(
-            timeout=15,
-            retry_count=2,
-            wait_time=1.0
-        )
-
-        print(f"  🔍 Scraping: {website}")
-        result = await engine.scrape(website, selectors, options)
-
-        if result.success:
+        data = None
+        if response_cache and not force_rescrape:
+            data = await response_cache.get_response(website)
+            # Duplicate websites that miss together: the first claims the
+            # scrape, the rest wait for its result
+            while data is None and (claim := response_cache.claim(website)) is None:
+                data = await response_cache.get_response(website)
+
+            if data is not None:
+                if data.get('failed'):
+                    print(f"  ⏭️  Skipping known failure: {data.get('error')}")
+                    return prospect
+                print(f"  💾 Cached: {website}")
+
+        if data is None:
+            # Stay polite per host without serializing unrelated sites
+            if rate_limiter:
+                await rate_limiter.acquire(urlparse(website).netloc)
+
+            print(f"  🔍 Scraping: {website}")
+            result = await engine.scrape(website, _SELECTORS, _SCRAPE_OPTIONS)
+
+            if result.success:
+                data = result.data
+                if response_cache:
+                    await response_cache.set_response(website, data, ttl=CACHE_TTL)
+            else:
+                print(f"  ❌ Scraping failed: {result.error}")
+                prospect['verification_confidence'] = 70  # LinkedIn only
+                if response_cache:
+                    await response_cache.set_response(
+                        website,
+                        {'failed': True, 'error': result.error},
+                        ttl=NEGATIVE_CACHE_TTL
+                    )
+
+        if data is not None:
             # Clean and add scraped data
-            data = result.data
 
             # Phone - clean tel: prefix
             if data.get('phone'):
@@ -159,27 +225,29 @@ async def enrich_company(engine: ScraperEngine, company: Dict) -> Dict:
             print(f"     Phone: {prospect['phone'][:20] if prospect['phone'] else 'N/A'}")
             print(f"     Email: {prospect['email'][:30] if prospect['email'] else 'N/A'}")
 
-        else:
-            print(f"  ❌ Scraping failed: {result.error}")
-            prospect['verification_confidence'] = 70  # LinkedIn only
-
     except Exception as e:
         print(f"  ⚠️  Error enriching: {e}")
         prospect['verification_confidence'] = 70  # LinkedIn only
 
-    # Add rate limit delay
-    await asyncio.sleep(2)
+    finally:
+        if claim is not None:
+            response_cache.release(website, claim)
 
     return prospect
 
 
-async def enrich_from_linkedin_export(input_csv: str, output_csv: str = None):
+async def enrich_from_linkedin_export(
+    input_csv: str,
+    output_csv: str = None,
+    force_rescrape: bool = False
+):
     """
     Enrich LinkedIn Sales Nav export with website data
 
     Args:
         input_csv: Path to LinkedIn export CSV
         output_csv: Path for output (defaults to enriched_[input].csv)
+        force_rescrape: Scrape every website even if cached
     """
     input_path = Path(input_csv)
 
@@ -198,71 +266,140 @@ async def enrich_from_linkedin_export(input_csv: str, output_csv: str = None):
     print(f"📂 Output: {output_csv}")
     print()
 
-    # Read LinkedIn export
-    with open(input_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        linkedin_data = list(reader)
-
-    print(f"📊 Found {len(linkedin_data)} companies from LinkedIn Sales Nav")
+    # Resume an interrupted run: the sidecar lists the input row indexes
+    # already written (names can repeat or be blank, so they can't key it)
+    progress_path = Path(f"{output_csv}.progress")
+    resuming = progress_path.exists() and Path(output_csv).exists()
+    done = (
+        {int(line) for line in progress_path.read_text(encoding='utf-8').split()}
+        if resuming else set()
+    )
+
+    def read_companies():
+        """Stream (row index, row) pairs one at a time, skipping rows already enriched"""
+        with open(input_csv, 'r', newline='', encoding='utf-8') as f:
+            for row, company in enumerate(csv.DictReader(f, restval='')):
+                if row not in done:
+                    yield row, company
+
+    # Counting pass keeps memory flat (rows are not materialized)
+    total = sum(1 for _ in read_companies())
+
+    print(f"📊 Found {total + len(done)} companies from LinkedIn Sales Nav")
     print()
+    if resuming:
+        print(f"⏯️  Resuming: {len(done)} already enriched, {total} remaining")
+        print()
 
-    # Initialize scraper
-    engine = ScraperEngine()
+    # Every row from this run shares one verification timestamp
+    run_ts = datetime.now().isoformat()
 
-    # Enrich each company
-    prospects = []
+    # Initialize scraper (at most one request every 2s per host)
+    engine = ScraperEngine()
+    engine.precompile_selectors(_SELECTORS)
+    rate_limiter = DomainRateLimiter(requests_per_second=0.5, burst=1)
+
+    # Persist scraped data next to the input so re-runs skip known sites
+    persistent_cache = SQLiteCache(input_path.parent / '.enrich_cache.sqlite', default_ttl=CACHE_TTL)
+    response_cache = ResponseCache(default_ttl=CACHE_TTL, persistent=persistent_cache)
+
+    # Producer -> N enrichment workers (network-bound) -> single CSV writer.
+    # Bounded queues keep only a few rows in memory at any time.
+    concurrency = int(os.getenv('ENRICH_CONCURRENCY', '15'))
+    companies: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    enriched: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def produce():
+        for i, (row, company) in enumerate(read_companies(), 1):
+            await companies.put((i, row, company))
+        for _ in range(concurrency):
+            await companies.put(None)
+
+    async def work():
+        while (item := await companies.get()) is not None:
+            i, row, company = item
+            print(f"\n[{i}/{total}] {company.get('company_name', 'Unknown')}")
+            print("-" * 80)
+            try:
+                prospect = await enrich_company(
+                    engine, company, rate_limiter, response_cache, force_rescrape, run_ts
+                )
+            except Exception as e:
+                print(f"⚠️  Enrichment crashed for {company.get('company_name', 'Unknown')}: {e}")
+                continue
+            await enriched.put((row, prospect))
+
+    async def run_pipeline():
+        try:
+            await asyncio.gather(produce(), *(work() for _ in range(concurrency)))
+        finally:
+            await enriched.put(None)
+
+    pipeline = asyncio.create_task(run_pipeline())
+
+    # Write each result as it completes so a crash loses at most one row
+    mode = 'a' if resuming else 'w'
+    with open(output_csv, mode, newline='', encoding='utf-8') as f, \
+            open(progress_path, mode, encoding='utf-8') as progress:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES, extrasaction='ignore')
+        if not resuming:
+            writer.writeheader()
 
-    for i, company in enumerate(linkedin_data, 1):
-        print(f"\n[{i}/{len(linkedin_data)}] {company.get('company_name', 'Unknown')}")
-        print("-" * 80)
+        try:
+            while (item := await enriched.get()) is not None:
+                row, prospect = item
+                writer.writerow(prospect)
+                f.flush()
+                progress.write(f"{row}\n")
+                progress.flush()
 
-        enriched = await enrich_company(engine, company)
-        prospects.append(enriched)
+            # Surface producer errors (e.g. malformed input)
+            await pipeline
+        finally:
+            pipeline.cancel()
+            await engine.close()
+            persistent_cache.close()
 
-    await engine.close()
+    # Run finished cleanly; the next run starts fresh
+    progress_path.unlink()
 
     print("\n" + "="*80)
     print("ENRICHMENT COMPLETE")
     print("="*80)
     print()
 
+    # Reload everything written (including resumed rows) for validation and stats
+    df = pd.read_csv(output_csv, dtype=str, keep_default_na=False, encoding='utf-8')
+    df['verified_website'] = df['verified_website'] == 'True'
+    df['verification_confidence'] = pd.to_numeric(df['verification_confidence'])
+
     # Validate
     print("🔍 Validating data quality...\n")
     validator = RealDataValidator(strict_mode=False)
-    results = validator.validate_dataset(prospects)
+    if len(df) >= validator.DATAFRAME_THRESHOLD:
+        results = validator.validate_dataset_df(df)
+    else:
+        results = validator.validate_dataset(df.to_dict('records'))
     validator.print_validation_report(results)
 
-    # Export
-    print(f"\n💾 Exporting to {output_csv}...\n")
-
-    with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-        if prospects:
-            fieldnames = [
-                'company_name', 'industry', 'location', 'employees',
-                'website', 'phone', 'email', 'address',
-                'services', 'certifications', 'linkedin_url',
-                'data_source', 'verified_date', 'verified_website',
-                'verification_confidence'
-            ]
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(prospects)
-
-    print(f"✅ Exported {len(prospects)} enriched prospects")
+    print(f"\n✅ Exported {len(df)} enriched prospects to {output_csv}")
     print()
 
-    # Summary stats
-    with_phone = len([p for p in prospects if p.get('phone')])
-    with_email = len([p for p in prospects if p.get('email')])
-    with_services = len([p for p in prospects if p.get('services')])
-    avg_confidence = sum(p.get('verification_confidence', 0) for p in prospects) / len(prospects)
+    if df.empty:
+        print("⚠️  No prospects enriched - nothing to summarize")
+        return
+
+    # Summary stats (one pass over the contact columns)
+    with_phone, with_email, with_services = (
+        df[['phone', 'email', 'services']].astype(bool).sum().tolist()
+    )
+    avg_confidence = df['verification_confidence'].mean()
 
     print("📊 ENRICHMENT STATS:")
-    print(f"  Total prospects:       {len(prospects)}")
-    print(f"  With phone numbers:    {with_phone} ({with_phone/len(prospects)*100:.1f}%)")
-    print(f"  With emails:           {with_email} ({with_email/len(prospects)*100:.1f}%)")
-    print(f"  With services:         {with_services} ({with_services/len(prospects)*100:.1f}%)")
+    print(f"  Total prospects:       {len(df)}")
+    print(f"  With phone numbers:    {with_phone} ({with_phone/len(df)*100:.1f}%)")
+    print(f"  With emails:           {with_email} ({with_email/len(df)*100:.1f}%)")
+    print(f"  With services:         {with_services} ({with_services/len(df)*100:.1f}%)")
     print(f"  Avg confidence score:  {avg_confidence:.1f}/100")
     print()
 
@@ -276,7 +413,10 @@ def print_usage():
 LinkedIn Sales Navigator Enricher
 
 USAGE:
-    python3 linkedin_enricher.py <input.csv> [output.csv]
+    python3 linkedin_enricher.py <input.csv> [output.csv] [--force-rescrape]
+
+OPTIONS:
+    --force-rescrape    Ignore cached results and scrape every website again
 
 INPUT CSV FORMAT (from LinkedIn Sales Navigator):
     Required columns:
@@ -323,11 +463,21 @@ WORKFLOW:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
+    args = [arg for arg in sys.argv[1:] if arg != '--force-rescrape']
+    force_rescrape = len(args) != len(sys.argv) - 1
+
+    if len(args) < 1:
         print_usage()
         sys.exit(1)
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    input_file = args[0]
+    output_file = args[1] if len(args) > 1 else None
+
+    # Faster event loop for the network-bound pipeline, when installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
 
-    asyncio.run(enrich_from_linkedin_export(input_file, output_file))
+    asyncio.run(enrich_from_linkedin_export(input_file, output_file, force_rescrape))
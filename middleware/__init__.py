@@ -4,7 +4,7 @@ Rate limiting, caching, and proxy management
 """
 
 from .rate_limiter import RateLimiter, RetryHandler, RetryConfig, CircuitBreaker
-from .cache import LRUCache, ResponseCache, TieredCache
+from .cache import LRUCache, ResponseCache, TieredCache, SQLiteCache
 from .proxy_manager import ProxyManager, UserAgentManager, HeaderGenerator
 
 __all__ = [
@@ -15,6 +15,7 @@ __all__ = [
     'LRUCache',
     'ResponseCache',
     'TieredCache',
+    'SQLiteCache',
     'ProxyManager',
     'UserAgentManager',
     'HeaderGenerator',
@@ -5,32 +5,45 @@ Multi-tier caching strategy with TTL support
 
 import asyncio
 import time
-import json
 import hashlib
+import heapq
 import logging
-from typing import Optional, Any, Dict
+import pickle
+import sqlite3
+import sys
+from typing import Optional, Any, Dict, List, Tuple
 from collections import OrderedDict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
-    """Single cache entry with metadata"""
+    """Single cache entry with metadata (slotted: no per-instance __dict__)"""
     key: str
     value: Any
     created_at: float
     ttl: int
     hits: int = 0
     size_bytes: int = 0
+    expires_at: float = field(init=False)
 
-    def is_expired(self) -> bool:
-        """Check if entry has expired"""
-        if self.ttl <= 0:
+    def __post_init__(self):
+        # Precomputed so each expiry check is one comparison (0 = never)
+        self.expires_at = self.created_at + self.ttl if self.ttl > 0 else 0.0
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """
+        Check if entry has expired
+
+        Args:
+            now: Current time.monotonic() value (None = read the clock)
+        """
+        if not self.expires_at:
             return False  # Never expires
-        return time.time() - self.created_at > self.ttl
+        return (now if now is not None else time.monotonic()) > self.expires_at
 
     def touch(self):
         """Update hit count"""
@@ -59,6 +72,8 @@ class LRUCache:
         self.max_size = max_size
         self.default_ttl = default_ttl
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []  # (expires_at, key)
+        self._total_size = 0  # Running sum of entry size_bytes
         self._lock = asyncio.Lock()
         self._hits = 0
         self._misses = 0
@@ -74,28 +89,36 @@ class LRUCache:
 
         Returns:
             Cached value or None if not found/expired
-        """
-        async with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                logger.debug(f"Cache miss: {key}")
-                return None
 
+        Note:
+            Reads are lock-free: nothing here awaits, so each step runs
+            without interleaving on the event loop. Hit/miss counters may
+            be slightly off if called from other threads.
+        """
+        try:
             entry = self._cache[key]
-
-            if entry.is_expired():
-                del self._cache[key]
-                self._misses += 1
-                logger.debug(f"Cache expired: {key}")
-                return None
-
-            # Move to end (most recently used)
+        except KeyError:
+            self._misses += 1
+            logger.debug(f"Cache miss: {key}")
+            return None
+
+        if entry.is_expired():
+            if self._cache.pop(key, None) is not None:
+                self._total_size -= entry.size_bytes
+            self._misses += 1
+            logger.debug(f"Cache expired: {key}")
+            return None
+
+        # Move to end (most recently used); may race with an eviction
+        try:
             self._cache.move_to_end(key)
-            entry.touch()
-            self._hits += 1
+        except KeyError:
+            pass
+        entry.touch()
+        self._hits += 1
 
-            logger.debug(f"Cache hit: {key} (hits={entry.hits})")
-            return entry.value
+        logger.debug(f"Cache hit: {key} (hits={entry.hits})")
+        return entry.value
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None):
         """
@@ -106,37 +129,54 @@ class LRUCache:
             value: Value to cache
             ttl: TTL in seconds (None = use default)
         """
-        async with self._lock:
-            ttl = ttl if ttl is not None else self.default_ttl
-
-            # Calculate size
-            try:
-                size_bytes = len(json.dumps(value))
-            except:
-                size_bytes = 0
-
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=time.time(),
-                ttl=ttl,
-                size_bytes=size_bytes
-            )
-
-            # If key exists, update it
-            if key in self._cache:
-                self._cache[key] = entry
-                self._cache.move_to_end(key)
-            else:
-                # Add new entry
-                self._cache[key] = entry
-
-                # Evict if over capacity
+        ttl = ttl if ttl is not None else self.default_ttl
+
+        # Cheap shallow size estimate (no re-serialization of the value)
+        size_bytes = sys.getsizeof(value)
+
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            created_at=time.monotonic(),
+            ttl=ttl,
+            size_bytes=size_bytes
+        )
+
+        if entry.expires_at:
+            heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+
+        # Assignment keeps an existing key's position, so move it explicitly
+        previous = self._cache.get(key)
+        if previous is not None:
+            self._total_size -= previous.size_bytes
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        self._total_size += size_bytes
+
+        # Only the compound eviction loop needs the lock
+        if len(self._cache) > self.max_size:
+            async with self._lock:
                 while len(self._cache) > self.max_size:
                     evicted_key, evicted_entry = self._cache.popitem(last=False)
+                    self._total_size -= evicted_entry.size_bytes
                     logger.debug(f"Cache evicted (LRU): {evicted_key}")
 
-            logger.debug(f"Cache set: {key} (ttl={ttl}s, size={size_bytes}B)")
+        # Overwrites and evictions leave stale heap items behind; rebuild
+        # from live entries once they outnumber them (amortized O(1))
+        if len(self._expiry_heap) > 2 * len(self._cache):
+            self._compact_expiry_heap()
+
+        logger.debug(f"Cache set: {key} (ttl={ttl}s, size={size_bytes}B)")
+
+    def _compact_expiry_heap(self):
+        """Rebuild the expiry heap from live entries, dropping stale items"""
+        heap = [
+            (entry.expires_at, key)
+            for key, entry in self._cache.items()
+            if entry.expires_at
+        ]
+        heapq.heapify(heap)
+        self._expiry_heap = heap
 
     async def delete(self, key: str) -> bool:
         """
@@ -150,7 +190,7 @@ class LRUCache:
         """
         async with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._total_size -= self._cache.pop(key).size_bytes
                 logger.debug(f"Cache deleted: {key}")
                 return True
             return False
@@ -159,38 +199,43 @@ class LRUCache:
         """Clear all cache entries"""
         async with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
+            self._total_size = 0
             self._hits = 0
             self._misses = 0
             logger.info("Cache cleared")
 
     async def cleanup_expired(self):
-        """Remove all expired entries"""
+        """Remove all expired entries (pops only due items off the expiry heap)"""
         async with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.is_expired()
-            ]
-
-            for key in expired_keys:
-                del self._cache[key]
-
-            if expired_keys:
-                logger.info(f"Cleaned up {len(expired_keys)} expired entries")
+            now = time.monotonic()
+            heap = self._expiry_heap
+            removed = 0
+
+            while heap and heap[0][0] < now:
+                _, key = heapq.heappop(heap)
+                # Heap items can be stale (key overwritten, evicted or deleted)
+                entry = self._cache.get(key)
+                if entry is not None and entry.is_expired(now):
+                    del self._cache[key]
+                    self._total_size -= entry.size_bytes
+                    removed += 1
+
+            if removed:
+                logger.info(f"Cleaned up {removed} expired entries")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         total_requests = self._hits + self._misses
         hit_rate = self._hits / total_requests if total_requests > 0 else 0
 
-        total_size = sum(entry.size_bytes for entry in self._cache.values())
-
         return {
             'size': len(self._cache),
             'max_size': self.max_size,
             'hits': self._hits,
             'misses': self._misses,
             'hit_rate': hit_rate,
-            'total_size_bytes': total_size,
+            'total_size_bytes': self._total_size,
             'utilization': len(self._cache) / self.max_size
         }
 
@@ -200,11 +245,32 @@ class ResponseCache(LRUCache):
     Specialized cache for HTTP responses
 
     Automatically generates cache keys from URLs and handles
-    response-specific caching logic.
+    response-specific caching logic. An optional persistent backend
+    (e.g. SQLiteCache) sits behind the in-memory LRU so responses
+    survive restarts. Concurrent fetches of the same response can be
+    coalesced with claim/release (single-flight).
     """
 
-    def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
+    # Request headers that affect the response (part of the cache key)
+    _KEY_HEADERS = ('Accept', 'Accept-Language', 'User-Agent')
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 3600,
+        persistent: Optional[Any] = None
+    ):
+        """
+        Initialize response cache
+
+        Args:
+            max_size: Maximum number of in-memory entries
+            default_ttl: Default TTL in seconds (0 = never expire)
+            persistent: Optional persistent cache with async get/set
+        """
         super().__init__(max_size, default_ttl)
+        self.persistent = persistent
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     def _make_key(
         self,
@@ -225,24 +291,25 @@ class ResponseCache(LRUCache):
         Returns:
             Cache key string
         """
-        # Include specific headers that affect response
-        cache_headers = {}
-        if headers:
-            for key in ['Accept', 'Accept-Language', 'User-Agent']:
-                if key in headers:
-                    cache_headers[key] = headers[key]
-
-        key_components = {
-            'url': url,
-            'method': method,
-            'headers': cache_headers,
-            'body': body
-        }
-
-        key_string = json.dumps(key_components, sort_keys=True)
-        key_hash = hashlib.sha256(key_string.encode()).hexdigest()[:16]
-
-        return f"response:{method}:{key_hash}"
+        # Hash the components directly (NUL-separated) instead of building
+        # and serializing a dict. Not a security primitive; 8-byte BLAKE2b
+        # is cheaper than SHA-256.
+        h = hashlib.blake2b(digest_size=8)
+        h.update(method.encode())
+        h.update(b'\0')
+        h.update(url.encode())
+
+        headers = headers or {}
+        for name in self._KEY_HEADERS:
+            h.update(b'\0')
+            h.update(headers.get(name, '').encode())
+
+        if body:
+            h.update(b'\0')
+            h.update(body.encode() if isinstance(body, str) else body)
+
+        # v3: key format changed (v2 hashed a JSON document)
+        return f"v3:response:{method}:{h.hexdigest()}"
 
     async def get_response(
         self,
@@ -251,9 +318,23 @@ class ResponseCache(LRUCache):
         headers: Optional[Dict] = None,
         body: Optional[str] = None
     ) -> Optional[Any]:
-        """Get cached response"""
+        """Get cached response (waits for an in-flight fetch of the same key)"""
         key = self._make_key(url, method, headers, body)
-        return await self.get(key)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Shielded so a cancelled waiter doesn't cancel the shared future
+            return await asyncio.shield(inflight)
+
+        value = await self.get(key)
+
+        if value is None and self.persistent:
+            value = await self.persistent.get(key)
+            if value is not None:
+                # Promote to memory
+                await self.set(key, value)
+
+        return value
 
     async def set_response(
         self,
@@ -264,10 +345,188 @@ class ResponseCache(LRUCache):
         body: Optional[str] = None,
         ttl: Optional[int] = None
     ):
-        """Cache response"""
+        """Cache response (and hand it to callers waiting on an in-flight fetch)"""
         key = self._make_key(url, method, headers, body)
         await self.set(key, response, ttl)
 
+        inflight = self._inflight.pop(key, None)
+        if inflight is not None and not inflight.done():
+            inflight.set_result(response)
+
+        if self.persistent:
+            await self.persistent.set(key, response, ttl if ttl is not None else self.default_ttl)
+
+    def claim(
+        self,
+        url: str,
+        method: str = 'GET',
+        headers: Optional[Dict] = None,
+        body: Optional[str] = None
+    ) -> Optional[asyncio.Future]:
+        """
+        Register the caller as the one fetching a response
+
+        Until the claim is settled by set_response or release, other
+        callers of get_response for the same key wait for its result.
+
+        Returns:
+            Token to pass to release, or None if another caller is already
+            fetching (await get_response for its result)
+        """
+        key = self._make_key(url, method, headers, body)
+        if key in self._inflight:
+            return None
+
+        token = asyncio.get_running_loop().create_future()
+        self._inflight[key] = token
+        return token
+
+    def release(
+        self,
+        url: str,
+        token: asyncio.Future,
+        method: str = 'GET',
+        headers: Optional[Dict] = None,
+        body: Optional[str] = None
+    ):
+        """
+        Settle a claim that ended without set_response
+
+        Waiters receive None and fall back to fetching themselves. No-op if
+        the claim was already settled.
+        """
+        key = self._make_key(url, method, headers, body)
+        if self._inflight.get(key) is token:
+            del self._inflight[key]
+        if not token.done():
+            token.set_result(None)
+
+
+class SQLiteCache:
+    """
+    Persistent cache backed by a SQLite file
+
+    Entries survive process restarts, so re-runs over the same inputs are
+    served from disk. Values are pickled; only point this at files you
+    trust. Blocking sqlite3 calls run in a worker thread, serialized by a
+    lock over one shared connection.
+    """
+
+    def __init__(self, path: str = 'cache.sqlite', default_ttl: int = 86400):
+        """
+        Initialize SQLite cache
+
+        Args:
+            path: Database file path (created if missing)
+            default_ttl: Default TTL in seconds (0 = never expire)
+        """
+        self.path = str(path)
+        self.default_ttl = default_ttl
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'key TEXT PRIMARY KEY, value BLOB, created_at REAL, ttl INTEGER)'
+        )
+        self._conn.commit()
+        self._lock = asyncio.Lock()
+
+        logger.info(f"SQLiteCache initialized: {self.path}, ttl={default_ttl}s")
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found/expired
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """
+        Set value in cache
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be picklable)
+            ttl: TTL in seconds (None = use default)
+        """
+        ttl = ttl if ttl is not None else self.default_ttl
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        async with self._lock:
+            await asyncio.to_thread(self._set_sync, key, blob, ttl)
+
+    async def delete(self, key: str) -> bool:
+        """
+        Delete entry from cache
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if deleted, False if not found
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self._execute, 'DELETE FROM cache WHERE key = ?', (key,)) > 0
+
+    async def clear(self):
+        """Clear all cache entries"""
+        async with self._lock:
+            await asyncio.to_thread(self._execute, 'DELETE FROM cache', ())
+        logger.info("SQLite cache cleared")
+
+    async def cleanup_expired(self):
+        """Remove all expired entries"""
+        async with self._lock:
+            removed = await asyncio.to_thread(
+                self._execute,
+                'DELETE FROM cache WHERE ttl > 0 AND ? - created_at > ttl',
+                (time.time(),)
+            )
+        if removed:
+            logger.info(f"Cleaned up {removed} expired entries")
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
+
+    def _get_sync(self, key: str) -> Optional[Any]:
+        """Blocking lookup (runs in a worker thread)"""
+        row = self._conn.execute(
+            'SELECT value, created_at, ttl FROM cache WHERE key = ?', (key,)
+        ).fetchone()
+
+        if row is None:
+            logger.debug(f"SQLite cache miss: {key}")
+            return None
+
+        blob, created_at, ttl = row
+        if ttl > 0 and time.time() - created_at > ttl:
+            self._execute('DELETE FROM cache WHERE key = ?', (key,))
+            logger.debug(f"SQLite cache expired: {key}")
+            return None
+
+        logger.debug(f"SQLite cache hit: {key}")
+        return pickle.loads(blob)
+
+    def _set_sync(self, key: str, blob: bytes, ttl: int):
+        """Blocking upsert (runs in a worker thread)"""
+        self._execute(
+            'INSERT OR REPLACE INTO cache (key, value, created_at, ttl) VALUES (?, ?, ?, ?)',
+            (key, blob, time.time(), ttl)
+        )
+
+    def _execute(self, sql: str, params: tuple) -> int:
+        """Run a write statement and commit, returning the affected row count"""
+        cursor = self._conn.execute(sql, params)
+        self._conn.commit()
+        return cursor.rowcount
+
 
 class TieredCache:
     """
@@ -286,7 +545,7 @@ class TieredCache:
         self,
         l1_cache: Optional[LRUCache] = None,
         l2_cache: Optional[Any] = None,  # Redis client
-        l3_cache: Optional[Any] = None   # Database client
+        l3_cache: Optional[Any] = None   # Database cache, e.g. SQLiteCache
     ):
         """
         Initialize tiered cache
@@ -294,7 +553,7 @@ class TieredCache:
         Args:
             l1_cache: L1 (memory) cache
             l2_cache: L2 (Redis) cache
-            l3_cache: L3 (database) cache
+            l3_cache: L3 (database) cache with async get/set, e.g. SQLiteCache
         """
         self.l1 = l1_cache or LRUCache(max_size=100, default_ttl=300)
         self.l2 = l2_cache
@@ -369,11 +628,9 @@ class TieredCache:
         pass
 
     async def _get_from_l3(self, key: str) -> Optional[Any]:
-        """Get from database cache (implement based on DB client)"""
-        # Placeholder - implement with actual database client
-        return None
+        """Get from database cache"""
+        return await self.l3.get(key)
 
     async def _set_to_l3(self, key: str, value: Any, ttl: Optional[int] = None):
-        """Set to database cache (implement based on DB client)"""
-        # Placeholder - implement with actual database client
-        pass
+        """Set to database cache"""
+        await self.l3.set(key, value, ttl)
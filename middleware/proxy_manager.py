@@ -4,16 +4,34 @@ Handles proxy rotation, health checking, and user-agent management
 """
 
 import asyncio
+import bisect
+import importlib.util
 import random
 import time
 import logging
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import accumulate, cycle
+from urllib.parse import urlparse
 import httpx
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Bound once: selection runs on every request and skips the module lookup
+_random = random.random
+_randrange = random.randrange
+_choice = random.choice
+
+# httpx needs the h2 package (httpx[http2]) to negotiate HTTP/2
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
 
 class ProxyHealth(Enum):
     """Proxy health status"""
@@ -22,15 +40,15 @@ class ProxyHealth(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyInfo:
-    """Information about a proxy"""
+    """Information about a proxy (slotted: no per-instance __dict__)"""
     url: str
     health: ProxyHealth = ProxyHealth.HEALTHY
     success_count: int = 0
     failure_count: int = 0
     avg_response_time: float = 0.0
-    last_checked: float = field(default_factory=time.time)
+    last_checked: float = field(default_factory=time.monotonic)
     total_requests: int = 0
 
     @property
@@ -69,6 +87,16 @@ class ProxyManager:
     - Performance tracking
     """
 
+    # Health-based selection samples a cached CDF (O(log n)) for small pools
+    # and switches to an O(1) alias table above this size
+    ALIAS_MIN_PROXIES = 64
+
+    # Maximum health checks in flight at once
+    HEALTH_CHECK_CONCURRENCY = 32
+
+    # Weight of the newest sample in the response-time moving average
+    EMA_ALPHA = 0.2
+
     def __init__(
         self,
         proxies: List[str],
@@ -88,14 +116,34 @@ class ProxyManager:
             max_failures: Max failures before marking proxy as failed
         """
         self.proxies = {url: ProxyInfo(url=url) for url in proxies}
+        # Non-failed proxies, maintained on health transitions
+        self._healthy: List[ProxyInfo] = list(self.proxies.values())
+        # Round-robin iterator over _healthy, rebuilt when it changes
+        self._rr_cycle = cycle(self._healthy)
         self.rotation_strategy = rotation_strategy
         self.health_check_interval = health_check_interval
         self.health_check_url = health_check_url
         self.max_failures = max_failures
 
-        self._current_index = 0
-        self._lock = asyncio.Lock()
         self._health_check_task = None
+        self._health_clients: Dict[str, httpx.AsyncClient] = {}
+
+        # Weighted-selection tables for health-based selection, rebuilt
+        # lazily when scores change (record_success/record_failure bump
+        # the version)
+        self._scores_version = 0
+
+        # Cumulative score distribution (small pools)
+        self._cdf_built_version = -1
+        self._cdf_proxies: List[ProxyInfo] = []
+        self._cdf: List[float] = []
+        self._cdf_total = 0.0
+
+        # Vose alias table (large pools)
+        self._alias_built_version = -1
+        self._alias_proxies: List[ProxyInfo] = []
+        self._alias_prob: List[float] = []
+        self._alias_idx: List[int] = []
 
         logger.info(
             f"ProxyManager initialized: {len(proxies)} proxies, "
@@ -109,92 +157,238 @@ class ProxyManager:
         Returns:
             Proxy URL or None if no healthy proxies
         """
-        healthy_proxies = [
-            info for info in self.proxies.values()
-            if info.health != ProxyHealth.FAILED
-        ]
+        healthy_proxies = self._healthy
 
         if not healthy_proxies:
             logger.error("No healthy proxies available")
             return None
 
-        if self.rotation_strategy == "round_robin":
-            proxy = self._round_robin_select(healthy_proxies)
-        elif self.rotation_strategy == "random":
-            proxy = random.choice(healthy_proxies)
-        elif self.rotation_strategy == "health_based":
-            proxy = self._health_based_select(healthy_proxies)
-        else:
-            proxy = healthy_proxies[0]
+        proxy = self._select(healthy_proxies)
 
-        logger.debug(f"Selected proxy: {proxy.url} (score={proxy.score:.2f})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Selected proxy: {proxy.url} (score={proxy.score:.2f})")
         return proxy.url
 
+    @property
+    def rotation_strategy(self) -> str:
+        """Proxy selection strategy"""
+        return self._rotation_strategy
+
+    @rotation_strategy.setter
+    def rotation_strategy(self, strategy: str):
+        """Set the strategy and bind its selector once, off the get_proxy path"""
+        self._rotation_strategy = strategy
+        self._select = {
+            "round_robin": self._round_robin_select,
+            "random": _choice,
+            "health_based": self._health_based_select,
+        }.get(strategy, self._first_select)
+
+    @staticmethod
+    def _first_select(proxies: List[ProxyInfo]) -> ProxyInfo:
+        """Fallback for unknown strategies: always the first proxy"""
+        return proxies[0]
+
     def _round_robin_select(self, proxies: List[ProxyInfo]) -> ProxyInfo:
         """Round-robin proxy selection"""
-        proxy = proxies[self._current_index % len(proxies)]
-        self._current_index += 1
-        return proxy
+        return next(self._rr_cycle)
 
     def _health_based_select(self, proxies: List[ProxyInfo]) -> ProxyInfo:
         """Select proxy based on health score"""
-        # Weight selection by score
-        scores = [proxy.score for proxy in proxies]
-        total_score = sum(scores)
+        if len(proxies) > self.ALIAS_MIN_PROXIES:
+            if self._alias_built_version != self._scores_version:
+                self._rebuild_alias(proxies)
+
+            # O(1) draw: pick a column, then the proxy or its alias
+            i = _randrange(len(self._alias_proxies))
+            if _random() < self._alias_prob[i]:
+                return self._alias_proxies[i]
+            return self._alias_proxies[self._alias_idx[i]]
 
-        if total_score == 0:
-            return random.choice(proxies)
+        if self._cdf_built_version != self._scores_version:
+            self._rebuild_cdf(proxies)
 
-        # Weighted random selection
-        weights = [score / total_score for score in scores]
-        return random.choices(proxies, weights=weights)[0]
+        if self._cdf_total <= 0:
+            return _choice(self._cdf_proxies)
+
+        # Weighted random selection: binary search the cumulative scores
+        i = bisect.bisect_right(self._cdf, _random() * self._cdf_total)
+        return self._cdf_proxies[min(i, len(self._cdf_proxies) - 1)]
+
+    def _rebuild_cdf(self, proxies: List[ProxyInfo]):
+        """
+        Cache the cumulative score distribution over proxies
+
+        Args:
+            proxies: Proxies eligible for selection
+        """
+        self._cdf = list(accumulate(proxy.score for proxy in proxies))
+        self._cdf_total = self._cdf[-1] if self._cdf else 0.0
+        self._cdf_proxies = list(proxies)
+        self._cdf_built_version = self._scores_version
+
+    def _rebuild_alias(self, proxies: List[ProxyInfo]):
+        """
+        Build a Vose alias table over proxies weighted by score
+
+        Args:
+            proxies: Proxies eligible for selection
+        """
+        n = len(proxies)
+
+        # Scale weights to mean 1 (all-zero scores fall back to uniform)
+        # and partition into under/over-full columns
+        if np is not None:
+            weights = np.fromiter((proxy.score for proxy in proxies), dtype=np.float64, count=n)
+            total_score = weights.sum()
+            if total_score > 0:
+                weights *= n / total_score
+            else:
+                weights.fill(1.0)
+            small = np.flatnonzero(weights < 1.0).tolist()
+            large = np.flatnonzero(weights >= 1.0).tolist()
+            scaled = weights.tolist()
+        else:
+            scores = [proxy.score for proxy in proxies]
+            total_score = sum(scores)
+            if total_score > 0:
+                scaled = [score * n / total_score for score in scores]
+            else:
+                scaled = [1.0] * n
+            small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+            large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+
+        # Tables stay plain lists: per-draw indexing is faster than numpy's
+        prob = [1.0] * n
+        alias = list(range(n))
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        # Leftovers (from float rounding) keep prob 1.0
+
+        self._alias_proxies = list(proxies)
+        self._alias_prob = prob
+        self._alias_idx = alias
+        self._alias_built_version = self._scores_version
 
     async def record_success(self, proxy_url: str, response_time: float):
         """
         Record successful request
 
+        Runs without a lock: there is no await between reading and
+        updating the proxy, so updates can't interleave on the event loop.
+
         Args:
             proxy_url: Proxy that was used
             response_time: Response time in seconds
         """
-        async with self._lock:
-            if proxy_url in self.proxies:
-                proxy = self.proxies[proxy_url]
-                proxy.success_count += 1
-                proxy.total_requests += 1
-
-                # Update average response time (exponential moving average)
-                alpha = 0.2  # Weight for new value
-                proxy.avg_response_time = (
-                    alpha * response_time +
-                    (1 - alpha) * proxy.avg_response_time
-                )
-
-                # Reset to healthy if it was degraded
-                if proxy.health == ProxyHealth.DEGRADED:
-                    proxy.health = ProxyHealth.HEALTHY
-                    logger.info(f"Proxy recovered: {proxy_url}")
+        proxy = self.proxies.get(proxy_url)
+        if proxy is None:
+            return
+
+        self._scores_version += 1
+        proxy.success_count += 1
+        proxy.total_requests += 1
+
+        # Update average response time (exponential moving average)
+        alpha = self.EMA_ALPHA
+        proxy.avg_response_time = (
+            alpha * response_time +
+            (1 - alpha) * proxy.avg_response_time
+        )
+
+        # Reset to healthy if it was degraded or failed (a failed
+        # proxy that passes a health check is back in rotation)
+        if proxy.health == ProxyHealth.FAILED:
+            # Start the failure count over, or one new failure re-fails it
+            proxy.failure_count = 0
+            self._healthy.append(proxy)
+            self._rr_cycle = cycle(self._healthy)
+        if proxy.health != ProxyHealth.HEALTHY:
+            proxy.health = ProxyHealth.HEALTHY
+            logger.info(f"Proxy recovered: {proxy_url}")
 
     async def record_failure(self, proxy_url: str):
         """
         Record failed request
 
+        Runs without a lock, like record_success.
+
         Args:
             proxy_url: Proxy that failed
         """
-        async with self._lock:
-            if proxy_url in self.proxies:
-                proxy = self.proxies[proxy_url]
-                proxy.failure_count += 1
-                proxy.total_requests += 1
-
-                # Update health status
-                if proxy.failure_count >= self.max_failures:
-                    proxy.health = ProxyHealth.FAILED
-                    logger.error(f"Proxy marked as failed: {proxy_url}")
-                elif proxy.success_rate < 0.5:
-                    proxy.health = ProxyHealth.DEGRADED
-                    logger.warning(f"Proxy degraded: {proxy_url}")
+        proxy = self.proxies.get(proxy_url)
+        if proxy is None:
+            return
+
+        self._scores_version += 1
+        proxy.failure_count += 1
+        proxy.total_requests += 1
+
+        # Update health status
+        if proxy.failure_count >= self.max_failures:
+            if proxy.health != ProxyHealth.FAILED:
+                self._healthy.remove(proxy)
+                self._rr_cycle = cycle(self._healthy)
+            proxy.health = ProxyHealth.FAILED
+            logger.error(f"Proxy marked as failed: {proxy_url}")
+
+            # Don't keep connections open to a failed proxy
+            client = self._health_clients.pop(proxy_url, None)
+            if client is not None:
+                await client.aclose()
+
+        elif proxy.success_rate < 0.5:
+            proxy.health = ProxyHealth.DEGRADED
+            logger.warning(f"Proxy degraded: {proxy_url}")
+
+    def bulk_load_history(self, proxy_url: str, response_times: Sequence[float]):
+        """
+        Replay historical successful response times for a proxy
+
+        Equivalent to calling record_success once per sample, but the
+        moving average is computed in closed form:
+        avg_n = (1-a)^n * avg_0 + sum(a * (1-a)^(n-1-k) * x_k)
+        which numpy evaluates as one dot product.
+
+        Args:
+            proxy_url: Proxy the samples belong to
+            response_times: Response times in seconds, oldest first
+        """
+        proxy = self.proxies.get(proxy_url)
+        n = len(response_times)
+        if proxy is None or n == 0:
+            return
+
+        alpha = self.EMA_ALPHA
+        decay = 1 - alpha
+
+        if np is not None:
+            samples = np.asarray(response_times, dtype=np.float64)
+            weights = alpha * decay ** np.arange(n - 1, -1, -1, dtype=np.float64)
+            avg = decay ** n * proxy.avg_response_time + float(weights @ samples)
+        else:
+            avg = proxy.avg_response_time
+            for response_time in response_times:
+                avg = alpha * response_time + decay * avg
+
+        proxy.avg_response_time = avg
+        proxy.success_count += n
+        proxy.total_requests += n
+        self._scores_version += 1
+
+        if proxy.health == ProxyHealth.FAILED:
+            # Start the failure count over, or one new failure re-fails it
+            proxy.failure_count = 0
+            self._healthy.append(proxy)
+            self._rr_cycle = cycle(self._healthy)
+        proxy.health = ProxyHealth.HEALTHY
 
     async def start_health_checks(self):
         """Start background health checking"""
@@ -213,6 +407,41 @@ class ProxyManager:
             self._health_check_task = None
             logger.info("Health check loop stopped")
 
+        clients = list(self._health_clients.values())
+        self._health_clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    def _get_health_client(self, proxy_url: str) -> httpx.AsyncClient:
+        """
+        Get the pooled health-check client for a proxy, creating it on first use
+
+        Keeping one client per proxy across checks reuses the TCP/TLS
+        session instead of paying a handshake every interval. Clients are
+        not shared between proxies behind the same gateway: httpx binds
+        the proxy URL (including credentials, which usually select the
+        exit) per client, and a check must go through the proxy under test.
+
+        Args:
+            proxy_url: Proxy the client routes through
+
+        Returns:
+            Pooled httpx.AsyncClient
+        """
+        client = self._health_clients.get(proxy_url)
+        if client is None:
+            client = httpx.AsyncClient(
+                proxy=proxy_url,
+                timeout=10.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=1,
+                    keepalive_expiry=self.health_check_interval * 2
+                ),
+                http2=_HTTP2_AVAILABLE
+            )
+            self._health_clients[proxy_url] = client
+        return client
+
     async def _health_check_loop(self):
         """Background task to periodically check proxy health"""
         while True:
@@ -225,15 +454,19 @@ class ProxyManager:
                 logger.error(f"Error in health check loop: {e}")
 
     async def _check_all_proxies(self):
-        """Check health of all proxies"""
+        """Check health of all proxies with a bounded pool of workers"""
         logger.info("Starting proxy health checks")
 
-        tasks = [
-            self._check_proxy(proxy_url)
-            for proxy_url in self.proxies.keys()
-        ]
+        # Workers pull from one shared iterator, so at most
+        # HEALTH_CHECK_CONCURRENCY checks (and sockets) are open at a time
+        proxy_urls = iter(list(self.proxies))
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+        async def worker():
+            for proxy_url in proxy_urls:
+                await self._check_proxy(proxy_url)
+
+        workers = min(self.HEALTH_CHECK_CONCURRENCY, len(self.proxies))
+        await asyncio.gather(*(worker() for _ in range(workers)), return_exceptions=True)
 
     async def _check_proxy(self, proxy_url: str):
         """
@@ -243,13 +476,13 @@ class ProxyManager:
             proxy_url: Proxy to check
         """
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
 
-            async with httpx.AsyncClient(proxies=proxy_url, timeout=10.0) as client:
-                response = await client.get(self.health_check_url)
-                response.raise_for_status()
+            client = self._get_health_client(proxy_url)
+            response = await client.get(self.health_check_url)
+            response.raise_for_status()
 
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
 
             await self.record_success(proxy_url, response_time)
             logger.debug(f"Proxy health check passed: {proxy_url} ({response_time:.2f}s)")
@@ -260,16 +493,13 @@ class ProxyManager:
 
     def get_stats(self) -> Dict:
         """Get proxy statistics"""
-        stats = {
-            'total_proxies': len(self.proxies),
-            'healthy': sum(1 for p in self.proxies.values() if p.health == ProxyHealth.HEALTHY),
-            'degraded': sum(1 for p in self.proxies.values() if p.health == ProxyHealth.DEGRADED),
-            'failed': sum(1 for p in self.proxies.values() if p.health == ProxyHealth.FAILED),
-            'proxies': []
-        }
+        # Single pass: count health states while building per-proxy stats
+        counts = dict.fromkeys(ProxyHealth, 0)
+        proxies = []
 
         for proxy in self.proxies.values():
-            stats['proxies'].append({
+            counts[proxy.health] += 1
+            proxies.append({
                 'url': proxy.url,
                 'health': proxy.health.value,
                 'success_rate': proxy.success_rate,
@@ -278,7 +508,13 @@ class ProxyManager:
                 'score': proxy.score
             })
 
-        return stats
+        return {
+            'total_proxies': len(self.proxies),
+            'healthy': counts[ProxyHealth.HEALTHY],
+            'degraded': counts[ProxyHealth.DEGRADED],
+            'failed': counts[ProxyHealth.FAILED],
+            'proxies': proxies
+        }
 
 
 class UserAgentManager:
@@ -323,8 +559,7 @@ class UserAgentManager:
             rotation_strategy: 'random' or 'round_robin'
         """
         self.rotation_strategy = rotation_strategy
-        self._current_index = 0
-        self._lock = asyncio.Lock()
+        self._rr_cycle = cycle(self.USER_AGENTS)
 
         logger.info(
             f"UserAgentManager initialized: {len(self.USER_AGENTS)} agents, "
@@ -339,10 +574,9 @@ class UserAgentManager:
             User-Agent string
         """
         if self.rotation_strategy == "round_robin":
-            ua = self.USER_AGENTS[self._current_index % len(self.USER_AGENTS)]
-            self._current_index += 1
+            ua = next(self._rr_cycle)
         else:
-            ua = random.choice(self.USER_AGENTS)
+            ua = _choice(self.USER_AGENTS)
 
         logger.debug(f"Selected user-agent: {ua[:50]}...")
         return ua
@@ -356,9 +590,17 @@ class UserAgentManager:
         """
         if user_agent not in self.USER_AGENTS:
             self.USER_AGENTS.append(user_agent)
+            self._rr_cycle = cycle(self.USER_AGENTS)
             logger.info(f"Added custom user-agent: {user_agent[:50]}...")
 
 
+@lru_cache(maxsize=1024)
+def _origin(url: str) -> str:
+    """Scheme and host of a URL as a Referer value (cached per URL)"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}/"
+
+
 class HeaderGenerator:
     """
     Generate realistic HTTP headers
@@ -366,6 +608,20 @@ class HeaderGenerator:
     Creates browser-like headers to avoid detection
     """
 
+    # Static browser headers (User-Agent is filled in per request)
+    _BASE_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0',
+    }
+
     def __init__(self, user_agent_manager: Optional[UserAgentManager] = None):
         """
         Initialize header generator
@@ -390,25 +646,12 @@ class HeaderGenerator:
         Returns:
             Dictionary of headers
         """
-        headers = {
-            'User-Agent': self.user_agent_manager.get(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0',
-        }
+        # User-Agent first, as browsers send it
+        headers = {'User-Agent': self.user_agent_manager.get(), **self._BASE_HEADERS}
 
         # Add referer for navigation
         if custom_headers and 'Referer' not in custom_headers:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            headers['Referer'] = f"{parsed.scheme}://{parsed.netloc}/"
+            headers['Referer'] = _origin(url)
 
         # Merge custom headers (override defaults)
         if custom_headers:
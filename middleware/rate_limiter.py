@@ -7,13 +7,16 @@ import asyncio
 import time
 import random
 import logging
-from typing import Optional, List
-from dataclasses import dataclass
+from typing import Optional, List, Tuple
+from dataclasses import dataclass, field
 from collections import deque
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Bound once: jitter is computed on every retry
+_random = random.random
+
 
 @dataclass
 class RetryConfig:
@@ -24,11 +27,19 @@ class RetryConfig:
     exponential_base: float = 2.0
     jitter: bool = True
     retry_on_status: List[int] = None  # HTTP status codes to retry on
+    # Backoff delay per attempt (before jitter), precomputed from the above
+    delays: Tuple[float, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.retry_on_status is None:
             self.retry_on_status = [429, 500, 502, 503, 504]
 
+        # Exponential backoff: base_delay * (exponential_base ^ attempt)
+        self.delays = tuple(
+            min(self.base_delay * (self.exponential_base ** attempt), self.max_delay)
+            for attempt in range(self.max_retries + 1)
+        )
+
 
 class RateLimiter:
     """
@@ -59,7 +70,9 @@ class RateLimiter:
         self.rate = requests_per_second
         self.burst = burst
         self.tokens = float(burst)
-        self.last_update = time.time()
+        # Event loop clock (monotonic); set on first acquire since the
+        # limiter may be created outside a running loop
+        self.last_update: Optional[float] = None
         self._lock = asyncio.Lock()
 
         logger.info(f"RateLimiter initialized: {requests_per_second} req/s, burst={burst}")
@@ -71,9 +84,15 @@ class RateLimiter:
         Args:
             tokens: Number of tokens to acquire
         """
-        async with self._lock:
-            while True:
-                now = time.time()
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Hold the lock only for the bucket update; waiters sleep
+            # concurrently and re-check when they wake
+            async with self._lock:
+                now = loop.time()
+                if self.last_update is None:
+                    self.last_update = now
                 elapsed = now - self.last_update
 
                 # Add new tokens based on elapsed time
@@ -90,8 +109,9 @@ class RateLimiter:
 
                 # Calculate wait time
                 wait_time = (tokens - self.tokens) / self.rate
-                logger.debug(f"Rate limit reached. Waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
+
+            logger.debug(f"Rate limit reached. Waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
 
     async def __aenter__(self):
         """Context manager support"""
@@ -128,12 +148,16 @@ class DomainRateLimiter:
         Args:
             domain: Domain name to rate limit
         """
-        async with self._lock:
-            if domain not in self._limiters:
-                self._limiters[domain] = RateLimiter(self.rate, self.burst)
-                logger.info(f"Created rate limiter for domain: {domain}")
+        # Lock-free fast path for known domains; only creation is locked
+        limiter = self._limiters.get(domain)
+        if limiter is None:
+            async with self._lock:
+                limiter = self._limiters.get(domain)
+                if limiter is None:
+                    limiter = self._limiters[domain] = RateLimiter(self.rate, self.burst)
+                    logger.info(f"Created rate limiter for domain: {domain}")
 
-        await self._limiters[domain].acquire()
+        await limiter.acquire()
 
     def get_stats(self):
         """Get statistics for all domains"""
@@ -230,16 +254,16 @@ class RetryHandler:
         Returns:
             Delay in seconds
         """
-        # Exponential backoff: base_delay * (exponential_base ^ attempt)
-        delay = min(
-            self.config.base_delay * (self.config.exponential_base ** attempt),
-            self.config.max_delay
-        )
+        config = self.config
+        if attempt < len(config.delays):
+            delay = config.delays[attempt]
+        else:
+            # max_retries was raised after the table was built
+            delay = min(config.base_delay * (config.exponential_base ** attempt), config.max_delay)
 
         # Add jitter to prevent thundering herd
-        if self.config.jitter:
-            jitter = random.uniform(0, delay * 0.1)  # Up to 10% jitter
-            delay += jitter
+        if config.jitter:
+            delay += _random() * delay * 0.1  # Up to 10% jitter
 
         return delay
 
@@ -304,13 +328,15 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError if circuit is open
         """
-        async with self._lock:
-            if self._state == self.OPEN:
-                if self._should_attempt_reset():
-                    self._state = self.HALF_OPEN
-                    logger.info("Circuit breaker entering HALF_OPEN state")
-                else:
-                    raise CircuitBreakerError("Circuit breaker is OPEN")
+        # Plain read of the state; only an OPEN circuit needs the lock
+        if self._state == self.OPEN:
+            async with self._lock:
+                if self._state == self.OPEN:
+                    if self._should_attempt_reset():
+                        self._state = self.HALF_OPEN
+                        logger.info("Circuit breaker entering HALF_OPEN state")
+                    else:
+                        raise CircuitBreakerError("Circuit breaker is OPEN")
 
         try:
             result = await func(*args, **kwargs)
@@ -323,6 +349,11 @@ class CircuitBreaker:
 
     async def _on_success(self):
         """Handle successful request"""
+        # Common case: nothing to transition, so skip the lock
+        if self._state == self.CLOSED:
+            self._failure_count = 0
+            return
+
         async with self._lock:
             self._failure_count = 0
 
@@ -337,7 +368,7 @@ class CircuitBreaker:
         """Handle failed request"""
         async with self._lock:
             self._failure_count += 1
-            self._last_failure_time = time.time()
+            self._last_failure_time = time.monotonic()
 
             if self._state == self.HALF_OPEN:
                 self._state = self.OPEN
@@ -353,7 +384,7 @@ class CircuitBreaker:
         """Check if enough time has passed to attempt recovery"""
         return (
             self._last_failure_time is not None and
-            time.time() - self._last_failure_time >= self.recovery_timeout
+            time.monotonic() - self._last_failure_time >= self.recovery_timeout
         )
 
     @property
@@ -398,6 +429,7 @@ class AdaptiveRateLimiter:
 
         self._limiter = RateLimiter(initial_rate)
         self._lock = asyncio.Lock()
+        self._logged_rate = initial_rate  # Last rate reported at info level
 
         logger.info(f"AdaptiveRateLimiter initialized: rate={initial_rate} req/s")
 
@@ -415,8 +447,13 @@ class AdaptiveRateLimiter:
             )
 
             if self.current_rate != old_rate:
-                self._limiter = RateLimiter(self.current_rate)
-                logger.info(f"Rate increased: {old_rate:.2f} -> {self.current_rate:.2f} req/s")
+                # Adjust in place; keeps the bucket's accumulated tokens
+                self._limiter.rate = self.current_rate
+
+                # Small steps add up; only log once the rate moved >10%
+                if abs(self.current_rate - self._logged_rate) > self._logged_rate * 0.1:
+                    logger.info(f"Rate increased: {self._logged_rate:.2f} -> {self.current_rate:.2f} req/s")
+                    self._logged_rate = self.current_rate
 
     async def on_rate_limit(self):
         """Decrease rate when rate limited"""
@@ -427,7 +464,8 @@ class AdaptiveRateLimiter:
                 self.current_rate * (1 - self.adjustment_factor)
             )
 
-            self._limiter = RateLimiter(self.current_rate)
+            self._limiter.rate = self.current_rate
+            self._logged_rate = self.current_rate
             logger.warning(f"Rate decreased: {old_rate:.2f} -> {self.current_rate:.2f} req/s")
 
     async def on_error(self):